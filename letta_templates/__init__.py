@@ -10,14 +10,18 @@ from .npc_tools import (
     TOOL_INSTRUCTIONS,
     TOOL_REGISTRY,
     NAVIGATION_TOOLS,
+    ToolInfo,
+    build_system_prompt,
     navigate_to,
     perform_action
 )
 
-__version__ = "0.2.11"
+__version__ = "0.3.0"
 __all__ = [
     "TOOL_INSTRUCTIONS",
     "TOOL_REGISTRY",
+    "ToolInfo",
+    "build_system_prompt",
     "perform_action",
     "navigate_to",
     "examine_object"
@@ -1,31 +1,78 @@
 import os
 from dotenv import load_dotenv
 from letta import EmbeddingConfig, LLMConfig, create_client, ChatMemory, BasicBlockMemory
-from letta.schemas.tool_rule import ToolRule, TerminalToolRule, InitToolRule
 from letta.prompts import gpt_system
 import json
 import time
 import argparse
-from typing import Optional
+import logging
+from typing import Callable, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
-from letta.schemas.tool import ToolUpdate
 from letta.schemas.message import (
     ToolCallMessage, 
     ToolReturnMessage, 
-    ReasoningMessage, 
-    Message
+    ReasoningMessage
 )
 from letta_templates.npc_tools import (
-    TOOL_INSTRUCTIONS, 
     TOOL_REGISTRY,
     NAVIGATION_TOOLS,
-    navigate_to  # Add this import
+    build_system_prompt,
+    examine_object
 )
 import requests
 
 # Load environment variables
 load_dotenv()
 
+# Named explicitly so messages stay under "letta_templates" when run as a script
+logger = logging.getLogger("letta_templates.letta_quickstart")
+
+# Shared pool for fanning out independent Letta API calls
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LETTA_IO_POOL", "8")),
+    thread_name_prefix="letta-io"
+)
+
+# Default locations memory shared by the example agents
+DEFAULT_LOCATIONS = {
+    "known_locations": [
+        {
+            "name": "Pete's Stand",
+            "description": "A friendly food stand run by Pete",
+            "coordinates": [-12.0, 18.9, -127.0],
+            "slug": "petes_stand"
+        },
+        {
+            "name": "Town Square",
+            "description": "Central gathering place with fountain",
+            "coordinates": [45.2, 12.0, -89.5],
+            "slug": "town_square"
+        },
+        {
+            "name": "Market District",
+            "description": "Busy shopping area with many vendors",
+            "coordinates": [-28.4, 15.0, -95.2],
+            "slug": "market_district"
+        },
+        {
+            "name": "Secret Garden",
+            "description": "A hidden garden with rare flowers",
+            "coordinates": [15.5, 20.0, -110.8]
+            # No slug - agent should use coordinates
+        }
+    ]
+}
+
+# Serialized once at import; the locations block is identical for every agent
+DEFAULT_LOCATIONS_JSON = json.dumps(DEFAULT_LOCATIONS)
+
+@lru_cache(maxsize=None)
+def load_system_prompt(key: str = "memgpt_chat") -> str:
+    """Read a Letta base system prompt from disk once per process."""
+    return gpt_system.get_system_text(key)
+
 def print_agent_details(client, agent_id, stage=""):
     """
     Print detailed information about an agent's configuration and memory.
@@ -122,36 +169,9 @@ def create_roblox_agent(client, name: str, persona: str = None):
         memory=ChatMemory(
             persona="A helpful NPC guide",
             human="A Roblox player exploring the game",
-            locations={
-                "known_locations": [
-                    {
-                        "name": "Pete's Stand",
-                        "description": "A friendly food stand run by Pete",
-                        "coordinates": [-12.0, 18.9, -127.0],
-                        "slug": "petes_stand"
-                    },
-                    {
-                        "name": "Town Square",
-                        "description": "Central gathering place with fountain", 
-                        "coordinates": [45.2, 12.0, -89.5],
-                        "slug": "town_square"
-                    },
-                    {
-                        "name": "Market District",
-                        "description": "Busy shopping area with many vendors",
-                        "coordinates": [-28.4, 15.0, -95.2],
-                        "slug": "market_district"
-                    },
-                    {
-                        "name": "Secret Garden",
-                        "description": "A hidden garden with rare flowers",
-                        "coordinates": [15.5, 20.0, -110.8]
-                        # No slug - agent should use coordinates
-                    }
-                ]
-            }
+            locations=json.loads(DEFAULT_LOCATIONS_JSON)  # fresh copy per agent
         ),
-        system=gpt_system.get_system_text("memgpt_chat"),
+        system=load_system_prompt(),
         include_base_tools=True,  # Keep base tools enabled
         tools=None,
         description="A Roblox development assistant"
@@ -203,7 +223,6 @@ def extract_message_from_response(response) -> str:
                     function_call = message.tool_call
                     if function_call and function_call.name == 'send_message':
                         # Parse the arguments JSON string
-                        import json
                         args = json.loads(function_call.arguments)
                         return args.get('message', '')
         return ''
@@ -233,9 +252,7 @@ def chat_with_agent(client, agent_id: str, message: str, role: str = "user") ->
 def create_letta_client():
     """Create Letta client with configuration"""
     base_url = os.getenv("LETTA_BASE_URL", "http://localhost:8283")
-    print("\nLetta Quickstart Configuration:")
-    print(f"Base URL: {base_url}")
-    print("-" * 50 + "\n")
+    logger.info("\nLetta Quickstart Configuration:\nBase URL: %s\n%s\n", base_url, "-" * 50)
     return create_client(base_url=base_url)
 
 def run_quick_test(client, npc_id="test-npc-1", user_id="test-user-1"):
@@ -283,9 +300,6 @@ def run_quick_test(client, npc_id="test-npc-1", user_id="test-user-1"):
 
 def get_or_create_tool(client, tool_name: str, tool_func=None, update_existing: bool = False):
     """Get existing tool or create if needed."""
-    # List all tools
-    tools = client.list_tools()
-    
     # During testing, always create new tools
     if tool_func:
         print(f"Creating new tool: {tool_name}")
@@ -293,6 +307,33 @@ def get_or_create_tool(client, tool_name: str, tool_func=None, update_existing:
     else:
         raise ValueError(f"Tool {tool_name} not found and no function provided to create it")
 
+def bulk_update_tools(client, tools: Dict[str, Callable]) -> Dict[str, str]:
+    """
+    Recreate a set of tools with a single listing and concurrent requests.
+    
+    Args:
+        client: Letta client instance
+        tools (dict): Mapping of tool name to tool function
+    
+    Returns:
+        dict: Mapping of tool name to the newly created tool ID
+    
+    Example:
+        >>> bulk_update_tools(client, {"examine_object": examine_object})
+        {'examine_object': 'tool-123'}
+    """
+    stale = [tool for tool in client.list_tools() if tool.name in tools]
+    
+    for tool in stale:
+        logger.info("Removing existing tool: %s", tool.name)
+    list(_IO_POOL.map(client.delete_tool, [tool.id for tool in stale]))
+    
+    created = _IO_POOL.map(
+        lambda item: client.create_tool(item[1], name=item[0]),
+        tools.items()
+    )
+    return {name: tool.id for name, tool in zip(tools, created)}
+
 def create_personalized_agent(
     name: str = "emma_research_assistant",
     client = None,
@@ -309,10 +350,10 @@ def create_personalized_agent(
     # Add timestamp to name to make it unique
     timestamp = int(time.time())
     unique_name = f"{name}_{timestamp}"
-    print(f"Creating agent with unique name: {unique_name}")
+    logger.info("Creating agent with unique name: %s", unique_name)
     
     # Get base system prompt
-    system_prompt = gpt_system.get_system_text("memgpt_chat")
+    system_prompt = load_system_prompt()
     
     # Create blocks first
     persona_block = client.create_block(
@@ -329,34 +370,7 @@ def create_personalized_agent(
     
     locations_block = client.create_block(
         label="locations",
-        value=json.dumps({
-            "known_locations": [
-                {
-                    "name": "Pete's Stand",
-                    "description": "A friendly food stand run by Pete",
-                    "coordinates": [-12.0, 18.9, -127.0],
-                    "slug": "petes_stand"
-                },
-                {
-                    "name": "Town Square",
-                    "description": "Central gathering place with fountain", 
-                    "coordinates": [45.2, 12.0, -89.5],
-                    "slug": "town_square"
-                },
-                {
-                    "name": "Market District",
-                    "description": "Busy shopping area with many vendors",
-                    "coordinates": [-28.4, 15.0, -95.2],
-                    "slug": "market_district"
-                },
-                {
-                    "name": "Secret Garden",
-                    "description": "A hidden garden with rare flowers",
-                    "coordinates": [15.5, 20.0, -110.8]
-                    # No slug - agent should use coordinates
-                }
-            ]
-        }),
+        value=DEFAULT_LOCATIONS_JSON,
         limit=5000
     )
     
@@ -368,7 +382,7 @@ def create_personalized_agent(
     # Create agent
     agent = client.create_agent(
         name=unique_name,
-        system=system_prompt + TOOL_INSTRUCTIONS,
+        system=build_system_prompt(system_prompt),
         memory=memory,
         include_base_tools=True,
         llm_config=LLMConfig(
@@ -388,18 +402,16 @@ def create_personalized_agent(
 
     # Register tools if requested
     if with_custom_tools:
-        # Clean up existing tools first
-        existing_tools = client.list_tools()
-        for tool in existing_tools:
-            if tool.name in NAVIGATION_TOOLS:
-                print(f"Removing existing tool: {tool.name}")
-                client.delete_tool(tool.id)
-        
-        # Register new tools
-        for name, info in NAVIGATION_TOOLS.items():
-            tool = client.create_tool(info["function"], name=name)
-            print(f"Created {name}: {tool.id}")
-            client.add_tool_to_agent(agent.id, tool.id)
+        # Replace any existing copies and register fresh tools
+        tool_ids = bulk_update_tools(
+            client,
+            {name: info.function for name, info in NAVIGATION_TOOLS.items()}
+        )
+        # Attach serially: each attach rewrites this agent's tool list on the
+        # server, so concurrent attaches can overwrite each other
+        for name, tool_id in tool_ids.items():
+            logger.info("Created %s: %s", name, tool_id)
+            client.add_tool_to_agent(agent.id, tool_id)
 
     return agent
 
@@ -509,9 +521,13 @@ def cleanup_test_tools(client, prefixes: list = ["examine_object", "navigate_to"
     tools = client.list_tools()
     cleaned = 0
     
+    # Build the match tables once instead of per tool
+    exact_names = frozenset(prefixes)
+    name_prefixes = tuple(f"{prefix}_" for prefix in prefixes)
+    
     print(f"\nCleaning up test tools with prefixes: {prefixes}")
     for tool in tools:
-        if any(tool.name == prefix or tool.name.startswith(f"{prefix}_") for prefix in prefixes):
+        if tool.name in exact_names or tool.name.startswith(name_prefixes):
             try:
                 client.delete_tool(tool.id)
                 cleaned += 1
@@ -548,12 +564,8 @@ def test_tool_update(client, agent_id: str):
             if system_update == "Updating examination capabilities...":
                 # Update the tool using our npc_tools version
                 print("\nUpdating examine tool...")
-                tools = client.list_tools()
-                for tool in tools:
-                    if tool.name == "examine_object":
-                        client.delete_tool(tool.id)
-                new_tool = client.create_tool(examine_object, name="examine_object")
-                print(f"Created new tool: {new_tool.id}")
+                tool_ids = bulk_update_tools(client, {"examine_object": examine_object})
+                print(f"Created new tool: {tool_ids['examine_object']}")
             else:
                 # Regular system update
                 print(f"\nSending system update: '{system_update}'")
@@ -819,6 +831,14 @@ def test_api_navigation():
 
 def main():
     args = parse_args()
+    # Send this package's progress output to stdout alongside the prints,
+    # without enabling INFO logging for third-party libraries
+    package_logger = logging.getLogger("letta_templates")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
     
     # Validate environment before proceeding
     if not validate_environment():
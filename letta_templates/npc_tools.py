@@ -3,18 +3,18 @@
 This module provides a complete set of NPC action tools for creating interactive game characters.
 
 Quick Start:
-    from npc_tools import TOOL_INSTRUCTIONS, TOOL_REGISTRY
+    from npc_tools import TOOL_INSTRUCTIONS, TOOL_REGISTRY, build_system_prompt
     
     # 1. Create agent with tools
     agent = client.create_agent(
         name="game_npc",
-        system=system_prompt + TOOL_INSTRUCTIONS,
+        system=build_system_prompt(system_prompt),
         include_base_tools=True
     )
     
     # 2. Register NPC tools
     for name, info in TOOL_REGISTRY.items():
-        tool = client.create_tool(info["function"], name=name)
+        tool = client.create_tool(info.function, name=name)
         print(f"Created {name}: {tool.id}")
 
 Features:
@@ -23,6 +23,13 @@ Features:
     - Navigation with state tracking
     - Object examination with progressive details
     
+Tool Functions:
+    - Registered tools are uploaded to the Letta server as source code
+      (client.create_tool reads them with inspect.getsource) and executed
+      there in isolation
+    - Keep tool bodies self-contained: no module-level helpers, constants
+      or dispatch tables, only builtins and imports inside the function
+    
 State Management:
     - Tools return current state in messages
     - Use system messages to update states
@@ -41,12 +48,12 @@ Example Usage:
 
 See TOOL_INSTRUCTIONS for complete usage documentation.
 """
-from typing import Dict, Callable, Optional, TypedDict, Union, List
-from typing_extensions import Any  # Use typing_extensions for Any
-import datetime
+from typing import Any, Dict, Callable, Mapping, Optional, TypedDict
 from dataclasses import dataclass
 from enum import Enum
-import json
+from functools import lru_cache
+from types import MappingProxyType
+import logging
 import os
 import requests
 from requests.adapters import HTTPAdapter
@@ -56,6 +63,29 @@ from urllib3.util.retry import Retry
 GAME_ID = int(os.getenv("LETTA_GAME_ID", "61"))
 NAVIGATION_CONFIDENCE_THRESHOLD = float(os.getenv("LETTA_NAV_THRESHOLD", "0.8"))
 LOCATION_API_URL = os.getenv("LOCATION_SERVICE_URL", "http://172.17.0.1:7777")
+LOCATION_CONNECT_TIMEOUT = float(os.getenv("LETTA_LOCATION_CONNECT_TIMEOUT", "0.5"))
+LOCATION_READ_TIMEOUT = float(os.getenv("LETTA_LOCATION_READ_TIMEOUT", "2.0"))
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Shared keep-alive session for all HTTP spoken by this module
+_LOCATION_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=1,  # one location-service host
+    pool_maxsize=4,
+    # Only retry transient 5xx responses: retrying connect errors or read
+    # timeouts would multiply the find_location timeout bound per attempt
+    max_retries=Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504)
+    )
+)
+_LOCATION_SESSION.mount("http://", _http_adapter)
+_LOCATION_SESSION.mount("https://", _http_adapter)
 
 # System prompt instructions for tools
 TOOL_INSTRUCTIONS = """
@@ -70,30 +100,40 @@ You have access to the following tools:
 2. `navigate_to` - For moving to specific locations:
    - ONLY use slugs from your locations memory block
    - Example: If your memory has "the_crematorium", use navigate_to("the_crematorium")
-   - Do not create or guess slugs - only use exact slugs from memory
 3. `examine_object` - For examining objects
 
 When asked to:
-- Follow someone: 
+- Follow someone:
    - Use perform_action with action='follow', target='specific_name'
    - If no target specified, follow the user you're talking to
 - Stop following: Use perform_action with action='unfollow'
 - Show emotion: Use perform_action with action='emote', type='wave|laugh|dance|cheer|point|sit'
-- Move somewhere: 
+- Move somewhere:
     - Check your locations memory for the correct slug
-    - Only use navigate_to with exact slugs from memory
     - If location not in memory, inform the user
 - Examine something: Use examine_object with object_name='item'
 
 Important notes:
 - Must unfollow before navigating to a new location
 - Emotes can include optional target (e.g., wave at someone)
-- Available emote types: wave, laugh, dance, cheer, point, sit
 - Tool names must be exactly as shown - no spaces or special characters
 - Always include request_heartbeat=True in tool calls
 - Never guess or create slugs - only use exact slugs from your locations memory
 """
 
+@lru_cache(maxsize=32)
+def build_system_prompt(base: str, *extra: str) -> str:
+    """Compose a system prompt from a base, optional extra sections and TOOL_INSTRUCTIONS.
+    
+    The parts are joined in one allocation and cached per combination, so
+    agents sharing a prompt reuse one string instead of building a new copy
+    on every creation.
+    
+    Example:
+        >>> build_system_prompt(base_prompt, persona_notes)
+    """
+    return "".join((base, *extra, TOOL_INSTRUCTIONS))
+
 # State enums for consistency
 class ActionProgress(Enum):
     INITIATED = "initiated"
@@ -101,7 +141,7 @@ class ActionProgress(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+@dataclass(slots=True)
 class ActionState:
     """Base state information for actions"""
     current_action: str
@@ -110,15 +150,27 @@ class ActionState:
     can_interact: bool = True
     interruption_allowed: bool = True
 
+@dataclass(slots=True, frozen=True)
+class ToolInfo:
+    """Registry entry for a tool function and its metadata"""
+    function: Callable
+    version: str
+    supports_state: bool
+
+# Message templates for _format_action_message, filled in per call
+_ACTION_MESSAGES: Dict[str, str] = {
+    "follow": "I am now following {target}. I'll maintain a respectful distance.",
+    "wave": "I'm waving{at_target}!",
+    "sit": "I've taken a seat. Feel free to continue our conversation."
+}
+
 def _format_action_message(action: str, target: Optional[str], state: ActionState) -> str:
     """Format natural language message for actions"""
-    messages = {
-        "follow": f"I am now following {target}. I'll maintain a respectful distance.",
-        "wave": f"I'm waving{' at ' + target if target else ''}!",
-        "sit": "I've taken a seat. Feel free to continue our conversation."
-    }
+    template = _ACTION_MESSAGES.get(action)
+    if template is None:
+        return f"Performing action: {action}{' targeting ' + target if target else ''}"
     
-    return messages.get(action, f"Performing action: {action}{' targeting ' + target if target else ''}")
+    return template.format(target=target, at_target=' at ' + target if target else '')
 
 def perform_action(action: str, type: Optional[str] = None, target: Optional[str] = None, request_heartbeat: bool = True) -> str:
     """
@@ -134,13 +186,13 @@ def perform_action(action: str, type: Optional[str] = None, target: Optional[str
         str: Description of the action performed
     """
     if action == 'emote' and type:
-        if type in ['wave', 'laugh', 'dance', 'cheer', 'point', 'sit']:
+        if type in {'wave', 'laugh', 'dance', 'cheer', 'point', 'sit'}:
             return f"Performing emote: {type}" + (f" at {target}" if target else "")
         return f"Unknown emote type: {type}"
     elif action == 'follow' and target:
         return f"Starting to follow {target}. Will maintain appropriate distance."
     elif action == 'unfollow':
-        return f"Stopping follow action. Now stationary."
+        return "Stopping follow action. Now stationary."
     return f"Unknown action: {action}"
 
 def navigate_to(destination: str, request_heartbeat: bool = True) -> dict:
@@ -179,7 +231,7 @@ def navigate_to(destination: str, request_heartbeat: bool = True) -> dict:
     return {
         "status": "success",
         "message": f"Navigating to {destination}",
-        "slug": destination.lower()
+        "slug": slug
     }
 
 def navigate_to_coordinates(x: float, y: float, z: float, request_heartbeat: bool = True) -> dict:
@@ -235,44 +287,40 @@ def examine_object(object_name: str, request_heartbeat: bool = True) -> str:
     )
 
 # Tool registry with metadata
-TOOL_REGISTRY: Dict[str, Dict] = {
-    "navigate_to": {
-        "function": navigate_to,
-        "version": "2.0.0",
-        "supports_state": True
-    },
-    "navigate_to_coordinates": {
-        "function": navigate_to_coordinates,
-        "version": "1.0.0",
-        "supports_state": True
-    },
-    "perform_action": {
-        "function": perform_action,
-        "version": "2.0.0",
-        "supports_state": True
-    },
-    "examine_object": {
-        "function": examine_object,
-        "version": "2.0.0",
-        "supports_state": True
-    }
-}
+TOOL_REGISTRY: Mapping[str, ToolInfo] = MappingProxyType({
+    "navigate_to": ToolInfo(navigate_to, "2.0.0", True),
+    "navigate_to_coordinates": ToolInfo(navigate_to_coordinates, "1.0.0", True),
+    "perform_action": ToolInfo(perform_action, "2.0.0", True),
+    "examine_object": ToolInfo(examine_object, "2.0.0", True)
+})
 
 # Production navigation tools
-NAVIGATION_TOOLS: Dict[str, Dict] = {
-    "navigate_to": TOOL_REGISTRY["navigate_to"],
-    "navigate_to_coordinates": TOOL_REGISTRY["navigate_to_coordinates"],
-    "perform_action": TOOL_REGISTRY["perform_action"]
+NAVIGATION_TOOLS: Mapping[str, ToolInfo] = MappingProxyType({
+    name: TOOL_REGISTRY[name]
+    for name in ("navigate_to", "navigate_to_coordinates", "perform_action")
+})
+
+# Flat name -> function table for dispatch, built once from the registry
+_TOOL_FUNCS: Dict[str, Callable] = {
+    name: info.function for name, info in TOOL_REGISTRY.items()
 }
 
+_STATEFUL_TOOLS = frozenset(
+    name for name, info in TOOL_REGISTRY.items() if info.supports_state
+)
+
 def get_tool(name: str) -> Callable:
     """Get tool function from registry"""
-    return TOOL_REGISTRY[name]["function"] 
+    return _TOOL_FUNCS[name]
+
+def supports_state(name: str) -> bool:
+    """Check whether a registered tool reports action state"""
+    return name in _STATEFUL_TOOLS
 
 class LocationData(TypedDict):
     name: str
     position: Dict[str, float]
-    metadata: Dict[str, any]
+    metadata: Dict[str, Any]
 
 class NavigationResponse(TypedDict):
     status: str
@@ -283,37 +331,33 @@ class NavigationResponse(TypedDict):
 def find_location(query: str, game_id: int = GAME_ID) -> Dict:
     """Query location service for destination."""
     try:
-        print(f"\nLocation Search:")
-        print(f"Query: '{query}'")
+        logger.debug("Location search: query=%r", query)
         
-        # Try to connect to service
-        try:
-            import socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = s.connect_ex(('localhost', 7777))
-            print(f"Port 7777 is {'open' if result == 0 else 'closed'}")
-            s.close()
-        except Exception as e:
-            print(f"Port check failed: {e}")
-            
         # Make request
-        response = requests.get(
+        response = _LOCATION_SESSION.get(
             "http://localhost:7777/api/locations/semantic-search",
             params={
                 "game_id": game_id,
                 "query": query,
                 "threshold": NAVIGATION_CONFIDENCE_THRESHOLD
-            }
+            },
+            timeout=(LOCATION_CONNECT_TIMEOUT, LOCATION_READ_TIMEOUT)
         )
         
-        print("\nLocation Service Response:")
-        print(f"Status Code: {response.status_code}")
-        print(f"Headers: {dict(response.headers)}")
-        print(f"Response Text: {response.text[:1000]}")
+        # Only materialize headers/body text when someone is listening
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Location service response: status=%s headers=%s text=%s",
+                response.status_code, dict(response.headers), response.text[:1000]
+            )
         
         response.raise_for_status()
         return response.json()
         
+    except (requests.Timeout, requests.ConnectionError) as e:
+        # Unreachable or hung service: fail fast instead of blocking the NPC
+        logger.warning("Location service unavailable: %s", e)
+        return {"message": "Service timeout", "locations": []}
     except Exception as e:
-        print(f"\nLocation Service Error: {str(e)}")
-        return {"message": "Service error", "locations": []}
\ No newline at end of file
+        logger.warning("Location service error: %s", e)
+        return {"message": "Service error", "locations": []}
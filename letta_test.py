@@ -1,4 +1,5 @@
 import os
+import json
 from dotenv import load_dotenv
 from letta import EmbeddingConfig, LLMConfig, create_client, ChatMemory
 from letta.prompts import gpt_system
@@ -149,7 +150,6 @@ try:
     for msg in response.messages:
         if hasattr(msg, 'function_call'):
             try:
-                import json
                 args = json.loads(msg.function_call.arguments)
                 if 'message' in args:
                     print(f"Response: {args['message']}")
@@ -1,4 +1,8 @@
 import pytest
+import requests
+import socket
+import threading
+import time
 from unittest.mock import patch, Mock
 from letta_templates.npc_tools import navigate_to, find_location
 import json
@@ -38,7 +42,7 @@ MOCK_NOT_FOUND = {
 
 @pytest.fixture
 def mock_requests():
-    with patch('letta_templates.npc_tools.requests.get') as mock_get:
+    with patch('letta_templates.npc_tools._LOCATION_SESSION.get') as mock_get:
         yield mock_get
 
 def test_successful_navigation(mock_requests):
@@ -82,7 +86,7 @@ def test_service_error(mock_requests):
 
 def test_find_location():
     """Test the location service wrapper."""
-    with patch('letta_templates.npc_tools.requests.get') as mock_get:
+    with patch('letta_templates.npc_tools._LOCATION_SESSION.get') as mock_get:
         # Test successful call
         mock_response = Mock()
         mock_response.json.return_value = MOCK_LOCATION_FOUND
@@ -96,4 +100,55 @@ def test_find_location():
         mock_get.side_effect = Exception("Connection error")
         result = find_location("Pete's stand")
         assert result["locations"] == []
-        assert "Service error" in result["message"] 
\ No newline at end of file
+        assert "Service error" in result["message"]
+
+def test_find_location_timeout():
+    """Test that an unreachable location service fails fast."""
+    with patch('letta_templates.npc_tools._LOCATION_SESSION.get') as mock_get:
+        mock_get.side_effect = requests.Timeout("Read timed out")
+        
+        result = find_location("Pete's stand")
+        assert result["locations"] == []
+        assert "timeout" in result["message"]
+        assert mock_get.call_args.kwargs["timeout"] is not None
+
+def test_location_session_fails_fast_on_hung_service():
+    """Test that a service that accepts but never replies is tried only once."""
+    from letta_templates.npc_tools import _LOCATION_SESSION
+    
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    port = server.getsockname()[1]
+    accepted = []
+    
+    def accept_forever():
+        while True:
+            try:
+                accepted.append(server.accept()[0])
+            except OSError:
+                return
+    
+    threading.Thread(target=accept_forever, daemon=True).start()
+    try:
+        start = time.monotonic()
+        with pytest.raises(requests.RequestException):
+            _LOCATION_SESSION.get(f"http://127.0.0.1:{port}/", timeout=(0.5, 0.3))
+        elapsed = time.monotonic() - start
+    finally:
+        server.close()
+        for conn in accepted:
+            conn.close()
+    
+    assert len(accepted) == 1
+    assert elapsed < 0.6
+
+def test_location_session_retry_policy_covers_https():
+    """Test that https uses the same status-only retry policy as http."""
+    from letta_templates.npc_tools import _LOCATION_SESSION
+    
+    for url in ("http://example.test", "https://example.test"):
+        retries = _LOCATION_SESSION.get_adapter(url).max_retries
+        assert retries.connect == 0
+        assert retries.read == 0
+        assert 503 in retries.status_forcelist
@@ -0,0 +1,45 @@
+import pytest
+from letta_templates.npc_tools import (
+    TOOL_INSTRUCTIONS,
+    TOOL_REGISTRY,
+    build_system_prompt,
+    get_tool,
+    navigate_to,
+    supports_state
+)
+
+def test_build_system_prompt():
+    """Test that tool instructions are appended and the result is reused."""
+    prompt = build_system_prompt("You are an NPC.")
+    
+    assert prompt == "You are an NPC." + TOOL_INSTRUCTIONS
+    assert build_system_prompt("You are an NPC.") is prompt
+    assert build_system_prompt("You are an NPC.", "\nBe brief.") == (
+        "You are an NPC.\nBe brief." + TOOL_INSTRUCTIONS
+    )
+
+def test_tool_registry_entries():
+    """Test registry entries expose the tool function and metadata."""
+    info = TOOL_REGISTRY["navigate_to"]
+    
+    assert info.function is navigate_to
+    assert info.supports_state
+    assert get_tool("navigate_to") is navigate_to
+    assert supports_state("navigate_to")
+    assert not supports_state("unknown_tool")
+
+def test_navigate_to_returns_clean_slug():
+    """Test that the returned slug is the normalized destination."""
+    result = navigate_to(" Petes_Stand ")
+    
+    assert result["status"] == "success"
+    assert result["slug"] == "petes_stand"
+
+def test_tool_registry_is_read_only():
+    """Test that the shared registry cannot be mutated by callers."""
+    with pytest.raises(TypeError):
+        TOOL_REGISTRY["navigate_to"] = None
+
+def test_tool_instructions_size_budget():
+    """Test that the prompt appended to every agent stays compact."""
+    assert len(TOOL_INSTRUCTIONS) <= 1500